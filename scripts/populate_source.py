@@ -6,12 +6,16 @@ This script connects to the source RDS PostgreSQL database and loads
 the sample e-commerce data from setup_source_data.sql.
 """
 
+import io
 import os
+import re
 import sys
 import json
+import logging
 import argparse
 import subprocess
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 try:
     import psycopg2
@@ -20,25 +24,91 @@ except ImportError:
     print("Error: psycopg2 is not installed. Run: pip install psycopg2-binary")
     sys.exit(1)
 
+try:
+    import sqlparse
+except ImportError:
+    print("Error: sqlparse is not installed. Run: pip install sqlparse")
+    sys.exit(1)
+
+log = logging.getLogger(__name__)
+
+LOG_FORMAT = '%(asctime)s %(levelname)s %(message)s'
+
+# Terraform outputs are cached here and reused until terraform.tfstate
+# changes, since each `terraform output` call takes seconds to start.
+TF_OUTPUTS_CACHE = Path.home() / '.cache' / 'aws-dms-poc' / 'tf-outputs.json'
+
+INSERT_VALUES_RE = re.compile(
+    r"^INSERT\s+INTO\s+(\w+)\s*\(([^)]*)\)\s*VALUES\s*(.*?);?\s*$",
+    re.IGNORECASE | re.DOTALL
+)
+
+IDENTIFIER_RE = re.compile(r"\w+")
+
+VALUE_TOKEN_RE = re.compile(r"""
+    (?P<skip>\s+|--[^\n]*)
+  | (?P<string>'(?:[^']|'')*')
+  | (?P<number>[-+]?\d+(?:\.\d+)?)
+  | (?P<keyword>NULL|TRUE|FALSE)\b
+  | (?P<punct>[(),])
+""", re.IGNORECASE | re.VERBOSE)
+
+
+def read_cached_terraform_outputs(terraform_dir: str) -> Optional[dict]:
+    """Return cached Terraform outputs if they are newer than the state file."""
+    state_file = Path(terraform_dir) / 'terraform.tfstate'
+    try:
+        if TF_OUTPUTS_CACHE.stat().st_mtime <= state_file.stat().st_mtime:
+            return None
+        with open(TF_OUTPUTS_CACHE, 'r') as f:
+            cached = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    
+    if cached.get('terraform_dir') != str(terraform_dir):
+        return None
+    return cached.get('outputs')
+
+
+def write_cached_terraform_outputs(terraform_dir: str, outputs: dict) -> None:
+    """Cache Terraform outputs in a file readable only by the current user."""
+    try:
+        TF_OUTPUTS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(TF_OUTPUTS_CACHE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'terraform_dir': str(terraform_dir), 'outputs': outputs}, f)
+    except OSError as e:
+        log.warning("Could not cache Terraform outputs: %s", e)
+
 
 def get_terraform_outputs(terraform_dir: str) -> dict:
-    """Get outputs from Terraform state."""
+    """Get outputs from Terraform state, reusing cached outputs when valid."""
+    outputs = read_cached_terraform_outputs(terraform_dir)
+    if outputs is not None:
+        log.info("Using cached Terraform outputs")
+        return outputs
+    
     try:
         result = subprocess.run(
-            ["terraform", "output", "-json"],
+            ["terraform", "output", "-json", "-no-color"],
             cwd=terraform_dir,
+            env={**os.environ, 'TF_IN_AUTOMATION': '1', 'TF_INPUT': '0'},
             capture_output=True,
             text=True,
             check=True
         )
         outputs = json.loads(result.stdout)
-        return {k: v.get("value") for k, v in outputs.items()}
+        outputs = {k: v.get("value") for k, v in outputs.items()}
     except subprocess.CalledProcessError as e:
-        print(f"Error getting Terraform outputs: {e.stderr}")
+        log.error("Error getting Terraform outputs: %s", e.stderr)
         sys.exit(1)
     except json.JSONDecodeError as e:
-        print(f"Error parsing Terraform outputs: {e}")
+        log.error("Error parsing Terraform outputs: %s", e)
         sys.exit(1)
+    
+    if outputs:
+        write_cached_terraform_outputs(terraform_dir, outputs)
+    return outputs
 
 
 def connect_to_database(host: str, port: int, database: str, 
@@ -57,28 +127,142 @@ def connect_to_database(host: str, port: int, database: str,
         conn.autocommit = True
         return conn
     except psycopg2.Error as e:
-        print(f"Error connecting to database: {e}")
+        log.error("Error connecting to database: %s", e)
         sys.exit(1)
 
 
+def strip_leading_comments(statement: str) -> str:
+    """Remove blank lines and -- comments preceding a statement."""
+    return re.sub(r"^(?:\s+|--[^\n]*)*", "", statement)
+
+
+def parse_insert_values(statement: str) -> Optional[Tuple[str, List[str], List[List[Optional[str]]]]]:
+    """Parse an INSERT ... VALUES statement whose values are all literals.
+    
+    Returns (table, columns, rows) with each value as COPY-ready text
+    (None for NULL), or None if the statement cannot be loaded with COPY.
+    """
+    match = INSERT_VALUES_RE.match(strip_leading_comments(statement))
+    if not match:
+        return None
+    
+    table, column_list, values = match.groups()
+    columns = [c.strip() for c in column_list.split(',')]
+    # Quoted or qualified names keep their exact spelling only via execute
+    if not all(IDENTIFIER_RE.fullmatch(name) for name in [table, *columns]):
+        return None
+    table = table.lower()
+    columns = [c.lower() for c in columns]
+    rows = []
+    row = None
+    pos = 0
+    
+    while pos < len(values):
+        token = VALUE_TOKEN_RE.match(values, pos)
+        if not token:
+            return None
+        pos = token.end()
+        kind = token.lastgroup
+        text = token.group(kind)
+        
+        if kind == 'skip':
+            continue
+        if kind == 'punct':
+            if text == '(' and row is None:
+                row = []
+            elif text == ')' and row is not None:
+                if len(row) != len(columns):
+                    return None
+                rows.append(row)
+                row = None
+            elif text != ',':
+                return None
+        elif row is None:
+            return None
+        elif kind == 'string':
+            row.append(text[1:-1].replace("''", "'"))
+        elif kind == 'number':
+            row.append(text)
+        elif text.upper() == 'NULL':
+            row.append(None)
+        else:
+            row.append(text.lower())
+    
+    if row is not None or not rows:
+        return None
+    return table, columns, rows
+
+
+def copy_rows(cursor, table: str, columns: List[str], rows: List[List[Optional[str]]]) -> None:
+    """Load rows into a table with COPY ... FROM STDIN."""
+    def escape(value: Optional[str]) -> str:
+        if value is None:
+            return '\\N'
+        return (value.replace('\\', '\\\\').replace('\t', '\\t')
+                .replace('\n', '\\n').replace('\r', '\\r'))
+    
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write('\t'.join(escape(value) for value in row) + '\n')
+    buffer.seek(0)
+    
+    copy_sql = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        sql.Identifier(table),
+        sql.SQL(', ').join(sql.Identifier(c) for c in columns)
+    )
+    cursor.copy_expert(copy_sql, buffer)
+
+
 def execute_sql_file(conn: psycopg2.extensions.connection, sql_file: str) -> None:
-    """Execute SQL commands from a file."""
-    print(f"Reading SQL file: {sql_file}")
+    """Execute SQL commands from a file, one statement at a time.
     
-    with open(sql_file, 'r', encoding='utf-8') as f:
-        sql_content = f.read()
+    The file is split into statements with sqlparse. INSERT ... VALUES
+    statements made only of literals are loaded with COPY, everything else
+    is executed as-is. The whole file runs in a single transaction.
+    """
+    log.info("Reading SQL file: %s", sql_file)
+    log.info("Executing SQL commands...")
     
-    print("Executing SQL commands...")
     cursor = conn.cursor()
+    conn.autocommit = False
+    executed = 0
+    copied = 0
+    statement = ''
     
     try:
-        cursor.execute(sql_content)
-        print("SQL execution completed successfully!")
-    except psycopg2.Error as e:
-        print(f"Error executing SQL: {e}")
+        with open(sql_file, 'r', encoding='utf-8') as f:
+            sql_content = f.read()
+        
+        # split() only lexes; grouping (parse/format) hits sqlparse's token
+        # limit on INSERTs of a thousand or so rows
+        for statement in sqlparse.split(sql_content):
+            if not strip_leading_comments(statement):
+                continue
+            
+            insert = parse_insert_values(statement)
+            if insert:
+                table, columns, rows = insert
+                copy_rows(cursor, table, columns, rows)
+                log.info("  Loaded %d rows into %s via COPY", len(rows), table)
+                copied += 1
+            else:
+                cursor.execute(statement)
+            executed += 1
+        
+        conn.commit()
+        log.info("SQL execution completed successfully! (%d statements, %d loaded via COPY)",
+                 executed, copied)
+    except Exception as e:
+        # The file is read and parsed inside the transaction, so any
+        # failure must roll back before autocommit can be restored
+        conn.rollback()
+        failed = strip_leading_comments(statement).split('\n', 1)[0]
+        log.error("Error executing SQL: %s", e)
+        log.error("Failed statement: %s", failed)
         raise
     finally:
         cursor.close()
+        conn.autocommit = True
 
 
 def verify_data_loaded(conn: psycopg2.extensions.connection) -> dict:
@@ -88,18 +272,15 @@ def verify_data_loaded(conn: psycopg2.extensions.connection) -> dict:
     tables = ['categories', 'customers', 'products', 'inventory', 'orders', 'order_items']
     counts = {}
     
-    print("\n" + "=" * 50)
-    print("Data Verification")
-    print("=" * 50)
+    log.info("Data verification:")
     
     for table in tables:
         cursor.execute(sql.SQL("SELECT COUNT(*) FROM {}").format(sql.Identifier(table)))
         count = cursor.fetchone()[0]
         counts[table] = count
-        print(f"  {table}: {count} records")
+        log.info("  %s: %d records", table, count)
     
     cursor.close()
-    print("=" * 50)
     
     return counts
 
@@ -119,12 +300,14 @@ def main():
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, stream=sys.stdout)
+    
     # Determine script directory
     script_dir = Path(__file__).parent.resolve()
     
     # Get connection info
     if args.use_terraform or (not args.host and not args.password):
-        print("Getting connection info from Terraform outputs...")
+        log.info("Getting connection info from Terraform outputs...")
         terraform_dir = (script_dir / args.terraform_dir).resolve()
         outputs = get_terraform_outputs(str(terraform_dir))
         
@@ -150,33 +333,30 @@ def main():
     # Determine SQL file path
     sql_file = args.sql_file or (script_dir / 'setup_source_data.sql')
     if not Path(sql_file).exists():
-        print(f"Error: SQL file not found: {sql_file}")
+        log.error("SQL file not found: %s", sql_file)
         sys.exit(1)
     
-    print("\n" + "=" * 50)
-    print("Source Database Population")
-    print("=" * 50)
-    print(f"Host: {host}")
-    print(f"Port: {port}")
-    print(f"Database: {database}")
-    print(f"Username: {username}")
-    print(f"SQL File: {sql_file}")
-    print("=" * 50 + "\n")
+    log.info("Source database population")
+    log.info("Host: %s", host)
+    log.info("Port: %s", port)
+    log.info("Database: %s", database)
+    log.info("Username: %s", username)
+    log.info("SQL File: %s", sql_file)
     
     # Connect and load data
-    print("Connecting to source database...")
+    log.info("Connecting to source database...")
     conn = connect_to_database(host, port, database, username, password)
-    print("Connected successfully!")
+    log.info("Connected successfully!")
     
     try:
         execute_sql_file(conn, str(sql_file))
         verify_data_loaded(conn)
     finally:
         conn.close()
-        print("\nDatabase connection closed.")
+        log.info("Database connection closed.")
     
-    print("\n✓ Source database populated successfully!")
-    print("  You can now start the DMS migration task.")
+    log.info("✓ Source database populated successfully!")
+    log.info("  You can now start the DMS migration task.")
 
 
 if __name__ == '__main__':
@@ -70,6 +70,12 @@ check_prerequisites() {
         pip3 install psycopg2-binary
     fi
     
+    # Check sqlparse
+    if ! python3 -c "import sqlparse" 2>/dev/null; then
+        log WARN "sqlparse not installed. Installing..."
+        pip3 install sqlparse
+    fi
+    
     # Check AWS credentials
     if ! aws sts get-caller-identity &> /dev/null; then
         log ERROR "AWS credentials not configured"
@@ -13,20 +13,81 @@ the source and target databases for:
 import os
 import sys
 import json
+import logging
 import argparse
-import hashlib
-import subprocess
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import cached_property, partial
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, List, Tuple, Optional
 
-try:
-    import psycopg2
-    from psycopg2 import sql
-except ImportError:
-    print("Error: psycopg2 is not installed. Run: pip install psycopg2-binary")
-    sys.exit(1)
+# psycopg2 and the hashing/subprocess modules are imported where they are
+# used, so that --help and argument errors return without loading them.
+if TYPE_CHECKING:
+    from psycopg2.pool import ThreadedConnectionPool
+
+
+log = logging.getLogger(__name__)
+
+LOG_FORMAT = '%(asctime)s %(levelname)s %(message)s'
+
+# Terraform outputs are cached here and reused until terraform.tfstate
+# changes, since each `terraform output` call takes seconds to start.
+TF_OUTPUTS_CACHE = Path.home() / '.cache' / 'aws-dms-poc' / 'tf-outputs.json'
+
+# Validation is network-latency bound, so per-table queries are fanned out
+# across this many worker threads, each with its own pooled connection.
+MAX_WORKERS = 16
+
+# Connections opened eagerly per database; the pool grows up to MAX_WORKERS.
+POOL_MIN_CONNECTIONS = 2
+
+# Sent with primary-key-ordered samples so they are read in index order
+# rather than sorted. Scoped to the statement's transaction.
+PK_ORDER_SETTINGS = "SET LOCAL enable_sort = off;"
+
+# Sent before any query whose row or key text is compared, so both databases
+# render values the same regardless of their server defaults. Scoped to the
+# statement's transaction.
+ROW_TEXT_SETTINGS = (
+    "SET LOCAL DateStyle = 'ISO, MDY';"
+    " SET LOCAL IntervalStyle = 'postgres';"
+    " SET LOCAL TimeZone = 'UTC';"
+    " SET LOCAL extra_float_digits = 1;"
+)
+
+# Bytes accumulated before each hasher.update() call in client mode.
+CHECKSUM_BUFFER_SIZE = 64 * 1024
+
+
+@contextmanager
+def borrow(db_pool: "ThreadedConnectionPool"):
+    """Borrow an autocommit connection from a pool for the duration of a block.
+    
+    The validator only reads, so autocommit makes each query a single
+    round-trip without BEGIN/ROLLBACK.
+    """
+    conn = db_pool.getconn()
+    conn.autocommit = True
+    try:
+        yield conn
+    finally:
+        db_pool.putconn(conn)
+
+
+@contextmanager
+def transaction(conn):
+    """Run a block inside an explicit transaction on an autocommit connection."""
+    conn.autocommit = False
+    try:
+        yield conn
+    finally:
+        # A dropped connection can't roll back; let the original error through
+        if not conn.closed:
+            conn.rollback()
+            conn.autocommit = True
 
 
 @dataclass
@@ -42,147 +103,323 @@ class ValidationResult:
 class DatabaseValidator:
     """Validates migration between source and target databases."""
     
-    def __init__(self, source_conn, target_conn):
-        self.source_conn = source_conn
-        self.target_conn = target_conn
+    def __init__(self, source_pool: "ThreadedConnectionPool",
+                 target_pool: "ThreadedConnectionPool", max_workers: int = MAX_WORKERS,
+                 checksum_mode: str = 'server'):
+        self.source_pool = source_pool
+        self.target_pool = target_pool
+        self.max_workers = max_workers
+        self.checksum_mode = checksum_mode
         self.results: List[ValidationResult] = []
+        self.row_count_matches: Dict[str, bool] = {}
+        self._catalog_cache: Dict[Tuple[str, int], Dict] = {}
+    
+    @cached_property
+    def source_tables(self) -> List[str]:
+        """User tables in the source database, queried once per run."""
+        return self.get_tables(self.source_pool)
+    
+    @cached_property
+    def target_tables(self) -> List[str]:
+        """User tables in the target database, queried once per run."""
+        return self.get_tables(self.target_pool)
+    
+    def _catalog(self, db_pool, loader: Callable) -> Dict:
+        """Load a bulk catalog query once per database and cache it."""
+        key = (loader.__name__, id(db_pool))
+        if key not in self._catalog_cache:
+            self._catalog_cache[key] = loader(db_pool)
+        return self._catalog_cache[key]
     
-    def get_tables(self, conn) -> List[str]:
+    def _gather(self, tasks: Dict[Hashable, Callable]) -> Dict[Hashable, object]:
+        """Run independent tasks concurrently on a worker pool.
+        
+        Returns each task's result by key, with any exception the task
+        raised in place of its result.
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(task): key for key, task in tasks.items()}
+            return {
+                futures[future]: future.exception() or future.result()
+                for future in as_completed(futures)
+            }
+    
+    def _on_both(self, func: Callable, *args, target_default=None) -> Tuple[object, object]:
+        """Run func against the source and target databases concurrently.
+        
+        Source errors propagate; a target error yields target_default.
+        """
+        results = self._gather({
+            'source': partial(func, self.source_pool, *args),
+            'target': partial(func, self.target_pool, *args),
+        })
+        if isinstance(results['source'], Exception):
+            raise results['source']
+        if isinstance(results['target'], Exception):
+            return results['source'], target_default
+        return results['source'], results['target']
+    
+    def get_tables(self, db_pool) -> List[str]:
         """Get list of user tables from the database."""
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT table_name 
-            FROM information_schema.tables 
-            WHERE table_schema = 'public' 
-              AND table_type = 'BASE TABLE'
-            ORDER BY table_name
-        """)
-        tables = [row[0] for row in cursor.fetchall()]
-        cursor.close()
-        return tables
-    
-    def get_row_count(self, conn, table: str) -> int:
-        """Get row count for a table."""
-        cursor = conn.cursor()
-        cursor.execute(sql.SQL("SELECT COUNT(*) FROM {}").format(sql.Identifier(table)))
-        count = cursor.fetchone()[0]
-        cursor.close()
-        return count
-    
-    def get_table_schema(self, conn, table: str) -> List[Dict]:
-        """Get schema definition for a table."""
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT 
-                column_name,
-                data_type,
-                character_maximum_length,
-                is_nullable,
-                column_default
-            FROM information_schema.columns
-            WHERE table_schema = 'public' AND table_name = %s
-            ORDER BY ordinal_position
-        """, (table,))
-        
-        columns = []
-        for row in cursor.fetchall():
-            columns.append({
-                'name': row[0],
-                'type': row[1],
-                'max_length': row[2],
-                'nullable': row[3],
-                'default': row[4]
-            })
-        cursor.close()
-        return columns
-    
-    def get_constraints(self, conn, table: str) -> List[Dict]:
-        """Get constraints for a table."""
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT 
-                tc.constraint_name,
-                tc.constraint_type,
-                kcu.column_name
-            FROM information_schema.table_constraints tc
-            JOIN information_schema.key_column_usage kcu 
-                ON tc.constraint_name = kcu.constraint_name
-                AND tc.table_schema = kcu.table_schema
-            WHERE tc.table_schema = 'public' AND tc.table_name = %s
-            ORDER BY tc.constraint_name, kcu.ordinal_position
-        """, (table,))
-        
-        constraints = []
-        for row in cursor.fetchall():
-            constraints.append({
-                'name': row[0],
-                'type': row[1],
-                'column': row[2]
-            })
-        cursor.close()
-        return constraints
-    
-    def get_indexes(self, conn, table: str) -> List[Dict]:
-        """Get indexes for a table."""
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT 
-                indexname,
-                indexdef
-            FROM pg_indexes
-            WHERE schemaname = 'public' AND tablename = %s
-            ORDER BY indexname
-        """, (table,))
-        
-        indexes = []
-        for row in cursor.fetchall():
-            indexes.append({
-                'name': row[0],
-                'definition': row[1]
-            })
-        cursor.close()
-        return indexes
-    
-    def get_data_checksum(self, conn, table: str, limit: int = 1000) -> str:
-        """Get checksum of table data (sample for performance)."""
-        cursor = conn.cursor()
-        
-        # Get primary key column
-        cursor.execute("""
-            SELECT a.attname
-            FROM pg_index i
-            JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
-            WHERE i.indrelid = %s::regclass AND i.indisprimary
-        """, (table,))
-        pk_result = cursor.fetchone()
-        
-        if pk_result:
-            pk_column = pk_result[0]
-            query = sql.SQL("""
-                SELECT * FROM {} ORDER BY {} LIMIT {}
+        with borrow(db_pool) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT table_name 
+                FROM information_schema.tables 
+                WHERE table_schema = 'public' 
+                  AND table_type = 'BASE TABLE'
+                ORDER BY table_name
+            """)
+            tables = [row[0] for row in cursor.fetchall()]
+            cursor.close()
+            return tables
+    
+    def get_row_counts(self, db_pool, tables: List[str]) -> Dict[str, int]:
+        """Get row counts for several tables in a single round-trip."""
+        from psycopg2 import sql
+        
+        if not tables:
+            return {}
+        
+        query = sql.SQL(" UNION ALL ").join(
+            sql.SQL("SELECT {}, COUNT(*) FROM {}").format(
+                sql.Literal(table),
+                sql.Identifier(table)
+            )
+            for table in tables
+        )
+        
+        with borrow(db_pool) as conn:
+            cursor = conn.cursor()
+            cursor.execute(query)
+            counts = dict(cursor.fetchall())
+            cursor.close()
+            return counts
+    
+    def get_all_schemas(self, db_pool) -> Dict[str, List[Dict]]:
+        """Get schema definitions for all tables, keyed by table name."""
+        with borrow(db_pool) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT 
+                    table_name,
+                    column_name,
+                    data_type,
+                    character_maximum_length,
+                    is_nullable,
+                    column_default
+                FROM information_schema.columns
+                WHERE table_schema = 'public'
+                ORDER BY table_name, ordinal_position
+            """)
+            
+            schemas = {}
+            for table, rows in groupby(cursor.fetchall(), key=itemgetter(0)):
+                schemas[table] = [
+                    {
+                        'name': row[1],
+                        'type': row[2],
+                        'max_length': row[3],
+                        'nullable': row[4],
+                        'default': row[5]
+                    }
+                    for row in rows
+                ]
+            cursor.close()
+            return schemas
+    
+    def get_all_constraints(self, db_pool) -> Dict[str, List[Dict]]:
+        """Get constraints for all tables, keyed by table name."""
+        with borrow(db_pool) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT 
+                    tc.table_name,
+                    tc.constraint_name,
+                    tc.constraint_type,
+                    kcu.column_name
+                FROM information_schema.table_constraints tc
+                JOIN information_schema.key_column_usage kcu 
+                    ON tc.constraint_name = kcu.constraint_name
+                    AND tc.table_schema = kcu.table_schema
+                    AND tc.table_name = kcu.table_name
+                WHERE tc.table_schema = 'public'
+                ORDER BY tc.table_name, tc.constraint_name, kcu.ordinal_position
+            """)
+            
+            constraints = {}
+            for table, rows in groupby(cursor.fetchall(), key=itemgetter(0)):
+                constraints[table] = [
+                    {
+                        'name': row[1],
+                        'type': row[2],
+                        'column': row[3]
+                    }
+                    for row in rows
+                ]
+            cursor.close()
+            return constraints
+    
+    def get_all_primary_keys(self, db_pool) -> Dict[str, str]:
+        """Get the leading primary key column of every table that has one.
+        
+        Read from pg_constraint rather than information_schema, which hides
+        tables the current role can only SELECT from.
+        """
+        with borrow(db_pool) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT 
+                    c.relname,
+                    a.attname
+                FROM pg_constraint con
+                JOIN pg_class c ON c.oid = con.conrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                JOIN pg_attribute a 
+                    ON a.attrelid = con.conrelid
+                    AND a.attnum = con.conkey[1]
+                WHERE con.contype = 'p'
+                AND n.nspname = 'public'
+            """)
+            pk_by_table = dict(cursor.fetchall())
+            cursor.close()
+            return pk_by_table
+    
+    def get_all_indexes(self, db_pool) -> Dict[str, List[Dict]]:
+        """Get indexes for all tables, keyed by table name."""
+        with borrow(db_pool) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT 
+                    tablename,
+                    indexname,
+                    indexdef
+                FROM pg_indexes
+                WHERE schemaname = 'public'
+                ORDER BY tablename, indexname
+            """)
+            
+            indexes = {}
+            for table, rows in groupby(cursor.fetchall(), key=itemgetter(0)):
+                indexes[table] = [
+                    {
+                        'name': row[1],
+                        'definition': row[2]
+                    }
+                    for row in rows
+                ]
+            cursor.close()
+            return indexes
+    
+    def get_primary_key(self, db_pool, table: str) -> Optional[str]:
+        """Get the primary key column of a table, if it has one.
+        
+        Answered from the cached primary key catalog without a query.
+        """
+        return self._catalog(db_pool, self.get_all_primary_keys).get(table)
+    
+    def get_key_range(self, db_pool, table: str) -> Optional[Tuple[str, str]]:
+        """Get the lowest and highest primary key values of a table as text."""
+        from psycopg2 import sql
+        
+        pk_column = self.get_primary_key(db_pool, table)
+        if not pk_column:
+            return None
+        
+        with borrow(db_pool) as conn:
+            cursor = conn.cursor()
+            # ORDER BY ... LIMIT 1 rather than MIN/MAX, which have no
+            # aggregate for key types such as uuid, bool and bytea
+            cursor.execute(sql.SQL(ROW_TEXT_SETTINGS) + sql.SQL("""
+                SELECT
+                    (SELECT {0} FROM {1} ORDER BY {0} LIMIT 1)::text,
+                    (SELECT {0} FROM {1} ORDER BY {0} DESC LIMIT 1)::text
             """).format(
+                sql.Identifier(pk_column),
+                sql.Identifier(table)
+            ))
+            key_range = cursor.fetchone()
+            cursor.close()
+            return key_range
+    
+    def get_data_checksum(self, db_pool, table: str, limit: Optional[int] = 1000) -> str:
+        """Get checksum of table data (sample for performance).
+        
+        In 'server' mode the sample is hashed by PostgreSQL and only the
+        digest is returned. In 'client' mode the sample is streamed as COPY
+        text and hashed locally, keeping the hashing work off the database
+        servers. Text rather than binary COPY is used because binary
+        arrays and composites embed type OIDs, which differ between
+        databases for user-defined types. A limit of None checksums
+        the whole table; in 'server' mode that digest is order-insensitive.
+        """
+        from psycopg2 import sql
+        
+        pk_column = self.get_primary_key(db_pool, table)
+        
+        if pk_column:
+            sample = sql.SQL("SELECT * FROM {} ORDER BY {} LIMIT {}").format(
                 sql.Identifier(table),
                 sql.Identifier(pk_column),
                 sql.Literal(limit)
             )
         else:
-            query = sql.SQL("SELECT * FROM {} LIMIT {}").format(
+            sample = sql.SQL("SELECT * FROM {} LIMIT {}").format(
                 sql.Identifier(table),
                 sql.Literal(limit)
             )
         
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        cursor.close()
-        
-        # Create checksum from data
-        data_str = str(rows)
-        return hashlib.md5(data_str.encode()).hexdigest()
+        # Keep the planner on the primary key index: a freshly loaded target
+        # can otherwise get a full scan and sort for the ORDER BY ... LIMIT
+        settings = sql.SQL(PK_ORDER_SETTINGS if pk_column else "")
+        
+        if self.checksum_mode == 'server':
+            row_text = sql.SQL(ROW_TEXT_SETTINGS)
+            if limit is None:
+                # string_agg builds one text value, which PostgreSQL caps at
+                # 1 GB; sum 64-bit prefixes of per-row hashes instead
+                query = row_text + sql.SQL("""
+                    SELECT md5(COALESCE(sum(('x' || left(md5(s::text), 16))::bit(64)::bigint), 0)::text)
+                    FROM {} s
+                """).format(sql.Identifier(table))
+            else:
+                order_by = sql.SQL("s.{}").format(sql.Identifier(pk_column)) if pk_column else sql.SQL("s::text")
+                query = row_text + settings + sql.SQL("""
+                    SELECT md5(COALESCE(string_agg(s::text, '' ORDER BY {}), ''))
+                    FROM ({}) s
+                """).format(order_by, sample)
+            
+            with borrow(db_pool) as conn:
+                cursor = conn.cursor()
+                cursor.execute(query)
+                checksum = cursor.fetchone()[0]
+                cursor.close()
+                return checksum
+        
+        # Stream the sample as raw COPY bytes straight into the hasher: no
+        # rows are decoded and memory stays constant regardless of size
+        with borrow(db_pool) as conn, transaction(conn):
+            cursor = conn.cursor()
+            cursor.execute(sql.SQL(ROW_TEXT_SETTINGS) + settings)
+            
+            sink = HashingWriter(new_hasher())
+            cursor.copy_expert(
+                sql.SQL("COPY ({}) TO STDOUT").format(sample),
+                sink
+            )
+            cursor.close()
+            return sink.hexdigest()
     
     def validate_table_existence(self) -> None:
         """Validate that all tables exist in both databases."""
-        source_tables = set(self.get_tables(self.source_conn))
-        target_tables = set(self.get_tables(self.target_conn))
+        self._gather({
+            'source': lambda: self.source_tables,
+            'target': lambda: self.target_tables,
+        })
+        source_tables = set(self.source_tables)
+        target_tables = set(self.target_tables)
         
         # Tables in source but not target
         missing_in_target = source_tables - target_tables
@@ -208,19 +445,30 @@ class DatabaseValidator:
     
     def validate_row_counts(self) -> None:
         """Validate row counts match between source and target."""
-        tables = self.get_tables(self.source_conn)
+        tables = self.source_tables
         all_match = True
         details = []
         
+        def load_target_counts() -> Dict[str, int]:
+            target_tables = set(self.target_tables)
+            return self.get_row_counts(
+                self.target_pool, [t for t in tables if t in target_tables]
+            )
+        
+        counts = self._gather({
+            'source': partial(self.get_row_counts, self.source_pool, tables),
+            'target': load_target_counts,
+        })
+        if isinstance(counts['source'], Exception):
+            raise counts['source']
+        source_counts = counts['source']
+        target_counts = {} if isinstance(counts['target'], Exception) else counts['target']
+        
         for table in tables:
-            source_count = self.get_row_count(self.source_conn, table)
-            
-            try:
-                target_count = self.get_row_count(self.target_conn, table)
-            except Exception:
-                target_count = 0
-            
+            source_count = source_counts[table]
+            target_count = target_counts.get(table, 0)
             match = source_count == target_count
+            self.row_count_matches[table] = match
             if not match:
                 all_match = False
             
@@ -237,17 +485,17 @@ class DatabaseValidator:
     
     def validate_schemas(self) -> None:
         """Validate schema structures match."""
-        tables = self.get_tables(self.source_conn)
+        tables = self.source_tables
         all_match = True
         details = []
         
+        source_schemas, target_schemas = self._on_both(
+            self._catalog, self.get_all_schemas, target_default={}
+        )
+        
         for table in tables:
-            source_schema = self.get_table_schema(self.source_conn, table)
-            
-            try:
-                target_schema = self.get_table_schema(self.target_conn, table)
-            except Exception:
-                target_schema = []
+            source_schema = source_schemas.get(table, [])
+            target_schema = target_schemas.get(table, [])
             
             # Compare column names and types
             source_cols = {col['name']: col['type'] for col in source_schema}
@@ -270,17 +518,17 @@ class DatabaseValidator:
     
     def validate_constraints(self) -> None:
         """Validate constraints are present in target."""
-        tables = self.get_tables(self.source_conn)
+        tables = self.source_tables
         all_match = True
         details = []
         
+        source_table_constraints, target_table_constraints = self._on_both(
+            self._catalog, self.get_all_constraints, target_default={}
+        )
+        
         for table in tables:
-            source_constraints = self.get_constraints(self.source_conn, table)
-            
-            try:
-                target_constraints = self.get_constraints(self.target_conn, table)
-            except Exception:
-                target_constraints = []
+            source_constraints = source_table_constraints.get(table, [])
+            target_constraints = target_table_constraints.get(table, [])
             
             source_pk = [c for c in source_constraints if c['type'] == 'PRIMARY KEY']
             target_pk = [c for c in target_constraints if c['type'] == 'PRIMARY KEY']
@@ -301,39 +549,75 @@ class DatabaseValidator:
         ))
     
     def validate_data_integrity(self, sample_size: int = 1000) -> None:
-        """Validate data integrity using checksums."""
-        tables = self.get_tables(self.source_conn)
-        all_match = True
-        details = []
+        """Validate data integrity using checksums.
         
+        Tables whose row counts or primary key ranges already differ are
+        reported as mismatches without computing a checksum.
+        """
+        tables = self.source_tables
+        details = {}
+        
+        candidates = []
         for table in tables:
-            try:
-                source_checksum = self.get_data_checksum(self.source_conn, table, sample_size)
-                target_checksum = self.get_data_checksum(self.target_conn, table, sample_size)
-                
-                match = source_checksum == target_checksum
-                if not match:
-                    all_match = False
-                
-                status = "✓" if match else "✗"
-                details.append(f"{status} {table}: {source_checksum[:8]}... vs {target_checksum[:8]}...")
-            except Exception as e:
-                all_match = False
-                details.append(f"✗ {table}: Error - {str(e)}")
+            if self.row_count_matches.get(table, True):
+                candidates.append(table)
+            else:
+                details[table] = f"✗ {table}: Skipped - row counts differ"
+        
+        # Primary keys come from a bulk catalog query; load it for both
+        # sides up front rather than racing to load it from every worker
+        self._on_both(self._catalog, self.get_all_primary_keys, target_default={})
+        
+        # Each side of each table is an independent query
+        sides = (('source', self.source_pool), ('target', self.target_pool))
+        key_ranges = self._gather({
+            (table, side): partial(self.get_key_range, db_pool, table)
+            for table in candidates for side, db_pool in sides
+        })
+        
+        to_checksum = []
+        for table in candidates:
+            source_range = key_ranges[(table, 'source')]
+            target_range = key_ranges[(table, 'target')]
+            
+            error = next((r for r in (source_range, target_range) if isinstance(r, Exception)), None)
+            if error:
+                details[table] = f"✗ {table}: Error - {str(error)}"
+            elif source_range != target_range:
+                details[table] = f"✗ {table}: Key range mismatch - {source_range} vs {target_range}"
+            else:
+                to_checksum.append(table)
+        
+        checksums = self._gather({
+            (table, side): partial(self.get_data_checksum, db_pool, table, sample_size)
+            for table in to_checksum for side, db_pool in sides
+        })
+        
+        for table in to_checksum:
+            source_checksum = checksums[(table, 'source')]
+            target_checksum = checksums[(table, 'target')]
+            
+            error = next((c for c in (source_checksum, target_checksum) if isinstance(c, Exception)), None)
+            if error:
+                details[table] = f"✗ {table}: Error - {str(error)}"
+                continue
+            
+            status = "✓" if source_checksum == target_checksum else "✗"
+            details[table] = f"{status} {table}: {source_checksum[:8]}... vs {target_checksum[:8]}..."
+        
+        all_match = all(detail.startswith("✓") for detail in details.values())
         
         self.results.append(ValidationResult(
             check_name="Data Integrity",
             passed=all_match,
-            source_value=details,
+            source_value=[details[table] for table in tables],
             target_value=None,
             message="Data integrity verified" if all_match else "Data integrity issues detected"
         ))
     
     def run_all_validations(self) -> List[ValidationResult]:
         """Run all validation checks."""
-        print("\n" + "=" * 60)
-        print("Running Migration Validation")
-        print("=" * 60)
+        log.info("Running migration validation")
         
         validations = [
             ("Table Existence", self.validate_table_existence),
@@ -344,7 +628,7 @@ class DatabaseValidator:
         ]
         
         for name, validation_func in validations:
-            print(f"\nValidating: {name}...")
+            log.info("Validating: %s...", name)
             try:
                 validation_func()
             except Exception as e:
@@ -360,6 +644,8 @@ class DatabaseValidator:
     
     def print_report(self) -> None:
         """Print validation report."""
+        from datetime import datetime
+        
         print("\n" + "=" * 60)
         print("MIGRATION VALIDATION REPORT")
         print("=" * 60)
@@ -389,6 +675,8 @@ class DatabaseValidator:
     
     def export_report(self, output_file: str) -> None:
         """Export validation report to JSON."""
+        from datetime import datetime
+        
         report = {
             'timestamp': datetime.now().isoformat(),
             'summary': {
@@ -409,45 +697,152 @@ class DatabaseValidator:
         with open(output_file, 'w') as f:
             json.dump(report, f, indent=2)
         
-        print(f"\nReport exported to: {output_file}")
+        log.info("Report exported to: %s", output_file)
+
+
+def new_hasher():
+    """Create a fast non-cryptographic hasher for data checksums.
+    
+    Uses XXH3 when the xxhash package is installed and falls back to
+    BLAKE2b, which is still considerably faster than MD5.
+    """
+    try:
+        import xxhash
+        return xxhash.xxh3_64()
+    except ImportError:
+        import hashlib
+        return hashlib.blake2b(digest_size=16)
+
+
+class HashingWriter:
+    """File-like sink that hashes everything written to it.
+    
+    COPY output arrives one row per write(); rows are buffered so the
+    hasher is fed CHECKSUM_BUFFER_SIZE blocks.
+    """
+    
+    def __init__(self, hasher):
+        self.hasher = hasher
+        self.buffer = bytearray()
+    
+    def write(self, data: bytes) -> int:
+        self.buffer += data
+        if len(self.buffer) >= CHECKSUM_BUFFER_SIZE:
+            self.hasher.update(self.buffer)
+            self.buffer.clear()
+        return len(data)
+    
+    def hexdigest(self) -> str:
+        self.hasher.update(self.buffer)
+        self.buffer.clear()
+        return self.hasher.hexdigest()
+
+
+def read_cached_terraform_outputs(terraform_dir: str) -> Optional[dict]:
+    """Return cached Terraform outputs if they are newer than the state file."""
+    state_file = Path(terraform_dir) / 'terraform.tfstate'
+    try:
+        if TF_OUTPUTS_CACHE.stat().st_mtime <= state_file.stat().st_mtime:
+            return None
+        with open(TF_OUTPUTS_CACHE, 'r') as f:
+            cached = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    
+    if cached.get('terraform_dir') != str(terraform_dir):
+        return None
+    return cached.get('outputs')
+
+
+def write_cached_terraform_outputs(terraform_dir: str, outputs: dict) -> None:
+    """Cache Terraform outputs in a file readable only by the current user."""
+    try:
+        TF_OUTPUTS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(TF_OUTPUTS_CACHE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'terraform_dir': str(terraform_dir), 'outputs': outputs}, f)
+    except OSError as e:
+        log.warning("Could not cache Terraform outputs: %s", e)
 
 
 def get_terraform_outputs(terraform_dir: str) -> dict:
-    """Get outputs from Terraform state."""
+    """Get outputs from Terraform state, reusing cached outputs when valid."""
+    outputs = read_cached_terraform_outputs(terraform_dir)
+    if outputs is not None:
+        log.info("Using cached Terraform outputs")
+        return outputs
+    
+    import subprocess
+    
     try:
         result = subprocess.run(
-            ["terraform", "output", "-json"],
+            ["terraform", "output", "-json", "-no-color"],
             cwd=terraform_dir,
+            env={**os.environ, 'TF_IN_AUTOMATION': '1', 'TF_INPUT': '0'},
             capture_output=True,
             text=True,
             check=True
         )
         outputs = json.loads(result.stdout)
-        return {k: v.get("value") for k, v in outputs.items()}
+        outputs = {k: v.get("value") for k, v in outputs.items()}
     except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
-        print(f"Error getting Terraform outputs: {e}")
+        log.error("Error getting Terraform outputs: %s", e)
         return {}
+    
+    if outputs:
+        write_cached_terraform_outputs(terraform_dir, outputs)
+    return outputs
 
 
 def connect_to_database(host: str, port: int, database: str,
-                        username: str, password: str):
-    """Create a connection to the PostgreSQL database."""
+                        username: str, password: str,
+                        max_connections: int = MAX_WORKERS) -> Optional["ThreadedConnectionPool"]:
+    """Create a thread-safe, read-only connection pool for the PostgreSQL database."""
     try:
-        conn = psycopg2.connect(
+        import psycopg2
+        from psycopg2 import pool
+    except ImportError:
+        log.error("psycopg2 is not installed. Run: pip install psycopg2-binary")
+        sys.exit(1)
+    
+    class PersistentConnectionPool(pool.ThreadedConnectionPool):
+        """ThreadedConnectionPool that keeps every connection it opens.
+        
+        psycopg2 closes returned connections once minconn are idle; keeping
+        them open up to maxconn lets later checks reuse connections instead
+        of reconnecting, while still only opening minconn eagerly.
+        """
+        
+        def __init__(self, minconn: int, maxconn: int, *args, **kwargs):
+            super().__init__(minconn, maxconn, *args, **kwargs)
+            self.minconn = maxconn
+    
+    try:
+        conn_pool = PersistentConnectionPool(
+            min(POOL_MIN_CONNECTIONS, max_connections), max_connections,
             host=host,
             port=port,
             database=database,
             user=username,
             password=password,
             connect_timeout=30,
-            sslmode='require'
+            sslmode='require',
+            options='-c default_transaction_read_only=on'
         )
-        return conn
+        return conn_pool
     except psycopg2.Error as e:
-        print(f"Error connecting to database: {e}")
+        log.error("Error connecting to database: %s", e)
         return None
 
 
+def positive_int(value: str) -> int:
+    """Parse a command-line integer that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(description='Validate DMS migration')
     
@@ -469,14 +864,20 @@ def main():
     parser.add_argument('--terraform-dir', default='../terraform')
     parser.add_argument('--use-terraform', action='store_true')
     parser.add_argument('--output-file', help='Output file for JSON report')
+    parser.add_argument('--checksum-mode', choices=['server', 'client'], default='server',
+                        help='Hash data samples in PostgreSQL (server) or locally (client)')
+    parser.add_argument('--max-workers', type=positive_int, default=MAX_WORKERS,
+                        help='Concurrent queries (and pooled connections) per database')
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, stream=sys.stdout)
+    
     script_dir = Path(__file__).parent.resolve()
     
     # Get connection info from Terraform if requested
     if args.use_terraform or (not args.source_host and not args.target_host):
-        print("Getting connection info from Terraform outputs...")
+        log.info("Getting connection info from Terraform outputs...")
         terraform_dir = (script_dir / args.terraform_dir).resolve()
         outputs = get_terraform_outputs(str(terraform_dir))
         
@@ -495,7 +896,7 @@ def main():
             target_database = target_info.get('database', args.target_database)
             target_username = target_info.get('username', args.target_username)
         else:
-            print("Warning: Could not get Terraform outputs")
+            log.warning("Could not get Terraform outputs")
             source_host = args.source_host
             source_port = args.source_port
             source_database = args.source_database
@@ -523,38 +924,36 @@ def main():
     if not target_password:
         target_password = source_password  # Often same password for both
     
-    print("\n" + "=" * 60)
-    print("Database Connection Info")
-    print("=" * 60)
-    print(f"Source: {source_host}:{source_port}/{source_database}")
-    print(f"Target: {target_host}:{target_port}/{target_database}")
-    print("=" * 60)
+    log.info("Source: %s:%s/%s", source_host, source_port, source_database)
+    log.info("Target: %s:%s/%s", target_host, target_port, target_database)
     
     # Connect to databases
-    print("\nConnecting to source database...")
-    source_conn = connect_to_database(
+    log.info("Connecting to source database...")
+    source_pool = connect_to_database(
         source_host, source_port, source_database, 
-        source_username, source_password
+        source_username, source_password, args.max_workers
     )
-    if not source_conn:
-        print("Failed to connect to source database")
+    if not source_pool:
+        log.error("Failed to connect to source database")
         sys.exit(1)
-    print("Connected to source database!")
+    log.info("Connected to source database!")
     
-    print("Connecting to target database...")
-    target_conn = connect_to_database(
+    log.info("Connecting to target database...")
+    target_pool = connect_to_database(
         target_host, target_port, target_database,
-        target_username, target_password
+        target_username, target_password, args.max_workers
     )
-    if not target_conn:
-        print("Failed to connect to target database")
-        source_conn.close()
+    if not target_pool:
+        log.error("Failed to connect to target database")
+        source_pool.closeall()
         sys.exit(1)
-    print("Connected to target database!")
+    log.info("Connected to target database!")
     
     try:
         # Run validation
-        validator = DatabaseValidator(source_conn, target_conn)
+        validator = DatabaseValidator(source_pool, target_pool,
+                                      max_workers=args.max_workers,
+                                      checksum_mode=args.checksum_mode)
         results = validator.run_all_validations()
         validator.print_report()
         
@@ -566,9 +965,9 @@ def main():
         sys.exit(0 if all_passed else 1)
         
     finally:
-        source_conn.close()
-        target_conn.close()
-        print("\nDatabase connections closed.")
+        source_pool.closeall()
+        target_pool.closeall()
+        log.info("Database connections closed.")
 
 
 if __name__ == '__main__':